@@ -1,4 +1,5 @@
 import argparse
+import functools
 import sys
 from typing import List
 from typing import Optional
@@ -8,10 +9,13 @@ from . import run_report
 # Package version
 __version__ = '0.1.0'
 
+@functools.lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
     """
     Create and configure the argument parser for the trip report CLI.
 
+    The parser is built once and reused on subsequent calls.
+
     Returns:
         argparse.ArgumentParser: Configured argument parser
     """
@@ -65,9 +69,9 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         '--file-method',
         type=str,
-        choices=['copy', 'symlink'],
+        choices=['copy', 'symlink', 'hardlink'],
         default='copy',
-        help='Method to use for file operations: copy or symlink files'
+        help='Method to use for file operations: copy, symlink or hardlink files'
     )
 
     parser.add_argument(
@@ -77,6 +81,22 @@ def create_parser() -> argparse.ArgumentParser:
         help='Trip directory has no site directory'
     )
 
+    parser.add_argument(
+        '--no-json',
+        action='store_false',
+        dest='write_json',
+        default=True,
+        help='Do not write the JSON data file alongside the report'
+    )
+
+    parser.add_argument(
+        '--sort-keys',
+        action='store_true',
+        dest='sort_json_keys',
+        default=False,
+        help='Sort dictionary keys in the JSON data file'
+    )
+
     parser.add_argument(
         '--csv',
         type=str,
@@ -111,7 +131,9 @@ def main(argv: Optional[List[str]] = None) -> int:
             report_name=args.report_name,
             file_method=args.file_method,
             no_site=args.no_site,
-            csv=args.csv
+            csv=args.csv,
+            write_json=args.write_json,
+            sort_json_keys=args.sort_json_keys
         )
         return 0
     except Exception as e:
@@ -1,13 +1,17 @@
+import functools
+import io
 import logging
+import os
+import re
+import stat
 import tarfile
-from collections import defaultdict
+import threading
+import xml.etree.ElementTree as ElementTree
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any, DefaultDict
-
-import xmltodict
-from box import Box
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union, Any
 
 from .logging_config import get_logger
 
@@ -22,6 +26,35 @@ class DirectoryType(Enum):
     SCREEN = "screen"
 
 
+# Default logger for collectors created without one
+_LOG = get_logger('imca_report.collect_data')
+
+# Default number of pucks processed concurrently
+DEFAULT_MAX_WORKERS = 8
+
+# Archive suffixes extracted in puck directories
+TAR_SUFFIXES = ('.tar', '.tar.gz', '.tar.bz2', '.tar.xz')
+
+# Read buffer size used when streaming tar files
+TAR_READ_BUFFER_SIZE = 128 * 1024
+
+# Suffix of the marker file written next to an extracted tar file
+TAR_SENTINEL_SUFFIX = '.extracted'
+
+# AutoProc XML elements that are extracted
+AUTOPROC_TAG = 'AutoProc'
+SCALING_STATISTICS_TAG = 'AutoProcScalingStatistics'
+
+# Read size used after the first stat-sized read of an XML file
+XML_READ_CHUNK_SIZE = 64 * 1024
+
+# Result files written by the diff-center alignment
+ZX_RESULT_FILE_NAME = 'imcadr-ZX-result.html'
+ZY_RESULT_FILE_NAME = 'imcadr-ZY-result.html'
+
+# Unit cell keys such as refinedCell_a, captures the cell parameter name
+CELL_KEY_PATTERN = re.compile(r'(?=.*Cell)[^_]*_([^_]*)')
+
 # Mapping for scaling statistics fields
 SCALING_STATISTICS_DICT = {
     "scalingstatisticstype": "Scaling Statistics Type",
@@ -45,6 +78,63 @@ SCALING_STATISTICS_DICT = {
 }
 
 
+# Display name of the statistics type field, which is used as the key instead
+SCALING_STATISTICS_TYPE_NAME = SCALING_STATISTICS_DICT["scalingstatisticstype"]
+
+
+@functools.lru_cache(maxsize=None)
+def _scaling_statistics_name(key: str) -> str:
+    """
+    Map a scaling statistics XML tag to its display name.
+
+    The XML tags have a stable casing, so each distinct tag is lowercased
+    and looked up only once.
+
+    Args:
+        key: XML tag of a scaling statistics field
+
+    Returns:
+        Display name, or the tag itself if it has none
+    """
+    return SCALING_STATISTICS_DICT.get(key.lower(), key)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_cell_value(value: Optional[str]) -> str:
+    """
+    Format a unit cell value with two decimals.
+
+    Cell parameters repeat across the collections of a trip, so each
+    distinct value string is converted and formatted only once.
+
+    Args:
+        value: Cell value text from the XML
+
+    Returns:
+        Value rounded to two decimals
+
+    Raises:
+        ValueError: If the value is not numeric
+        TypeError: If the value is None
+    """
+    return format(float(value), '.2f')
+
+
+def _element_fields(elem: ElementTree.Element) -> Dict[str, Optional[str]]:
+    """
+    Map the child tags of an XML element to their text.
+
+    Text is stripped and empty text becomes None.
+
+    Args:
+        elem: XML element with leaf children
+
+    Returns:
+        Dictionary of child tag to text
+    """
+    return {child.tag: (child.text.strip() or None) if child.text else None for child in elem}
+
+
 @dataclass
 class ProcessingStats:
     """Statistics for data processing operations"""
@@ -56,6 +146,16 @@ class ProcessingStats:
     skipped_collections: int = 0
     errors: List[Dict[str, str]] = field(default_factory=list)
 
+    def merge(self, other: 'ProcessingStats') -> None:
+        """Add the counts and errors of another stats object to this one."""
+        self.total_pucks += other.total_pucks
+        self.processed_pucks += other.processed_pucks
+        self.skipped_pucks += other.skipped_pucks
+        self.total_collections += other.total_collections
+        self.processed_collections += other.processed_collections
+        self.skipped_collections += other.skipped_collections
+        self.errors.extend(other.errors)
+
 
 class SynchrotronDataProcessingError(Exception):
     """Custom exception for synchrotron data processing errors."""
@@ -67,6 +167,137 @@ class XmlParsingError(SynchrotronDataProcessingError):
     pass
 
 
+def _extract_tar_archive(tar_path: str) -> None:
+    """
+    Extract a tar file next to itself.
+
+    The archive is read in streaming mode, a single forward pass through a
+    large read buffer, since every member is extracted anyway.
+
+    Args:
+        tar_path: Path to tar file
+    """
+    with open(tar_path, 'rb', buffering=TAR_READ_BUFFER_SIZE) as raw:
+        with tarfile.open(fileobj=raw, mode='r|*') as tar:
+            tar.extractall(path=os.path.dirname(tar_path))
+
+    # Record the extraction so later runs can skip this archive
+    try:
+        Path(tar_path + TAR_SENTINEL_SUFFIX).touch()
+    except OSError:
+        pass
+
+
+def _is_extracted(tar_path: Path) -> bool:
+    """
+    Check whether a tar file was already extracted by a previous run.
+
+    Args:
+        tar_path: Path to tar file
+
+    Returns:
+        True if a sentinel file at least as new as the archive exists
+    """
+    sentinel = tar_path.with_suffix(tar_path.suffix + TAR_SENTINEL_SUFFIX)
+    try:
+        return sentinel.stat().st_mtime >= tar_path.stat().st_mtime
+    except OSError:
+        return False
+
+
+def _read_file_bytes(file_path: str, size: int) -> bytes:
+    """
+    Read a whole file with as few read() syscalls as possible.
+
+    Bypasses the buffered io layer and sizes the first read from the
+    file's stat size. Reading continues until end of file, in case the
+    file grew since it was stat'ed.
+
+    Args:
+        file_path: Path to the file
+        size: Expected size of the file in bytes
+
+    Returns:
+        File contents
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        chunks = []
+        chunk = os.read(fd, size + 1)
+        while chunk:
+            chunks.append(chunk)
+            chunk = os.read(fd, XML_READ_CHUNK_SIZE)
+    finally:
+        os.close(fd)
+    return b''.join(chunks)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_autoproc_xml(
+        file_path: str,
+        mtime_ns: int,
+        size: int
+) -> Optional[Tuple[Dict[str, Optional[str]], Tuple[Dict[str, Optional[str]], ...]]]:
+    """
+    Parse the AutoProc and scaling statistics blocks of an AutoProc XML file.
+
+    The file is read as raw bytes, leaving encoding detection to the XML
+    declaration, then parsed incrementally. Only the AutoProc and
+    AutoProcScalingStatistics elements are kept; everything else is
+    cleared as soon as it has been parsed to keep memory flat.
+
+    Results are cached by path, modification time and size, so unchanged
+    files are parsed only once per process. Cached dictionaries are shared
+    between callers and must not be modified.
+
+    Args:
+        file_path: Path to XML file
+        mtime_ns: Modification time of the file in nanoseconds, part of the cache key
+        size: Size of the file in bytes, part of the cache key
+
+    Returns:
+        Tuple of the first AutoProc block's fields and the fields of
+        every scaling statistics block, or None if the file only holds
+        whitespace
+
+    Raises:
+        XmlParsingError: If the file cannot be read or parsed
+    """
+    auto_proc: Dict[str, Optional[str]] = {}
+    scaling_stats: List[Dict[str, Optional[str]]] = []
+    collecting = 0
+    try:
+        raw = _read_file_bytes(file_path, size)
+        if not raw.strip():
+            return None
+
+        for event, elem in ElementTree.iterparse(io.BytesIO(raw), events=('start', 'end')):
+            tag = elem.tag
+            if event == 'start':
+                if tag == AUTOPROC_TAG or tag == SCALING_STATISTICS_TAG:
+                    collecting += 1
+                continue
+
+            if tag == AUTOPROC_TAG:
+                if not auto_proc:
+                    auto_proc = _element_fields(elem)
+                collecting -= 1
+                elem.clear()
+            elif tag == SCALING_STATISTICS_TAG:
+                scaling_stats.append(_element_fields(elem))
+                collecting -= 1
+                elem.clear()
+            elif not collecting:
+                elem.clear()
+    except (ElementTree.ParseError, LookupError, UnicodeDecodeError, ValueError) as xml_err:
+        # Unknown or mismatched encodings surface as LookupError and ValueError
+        raise XmlParsingError(f"XML parsing error: {xml_err}") from xml_err
+    except OSError as e:
+        raise XmlParsingError(f"Failed to read XML file: {e}") from e
+
+    return auto_proc, tuple(scaling_stats)
+
+
 class SynchrotronDataCollector:
     """
     A class to collect and process synchrotron data from a given directory structure.
@@ -89,23 +320,104 @@ class SynchrotronDataCollector:
     differently to extract relevant information.
     """
 
-    def __init__(self, base_path: Union[str, Path], logger: Optional[logging.Logger] = None):
+    # Directory name -> name of the method that processes it
+    _PROCESSOR_NAMES: Dict[str, str] = {
+        DirectoryType.CAMERA.value: '_process_camera_directory',
+        DirectoryType.IMAGES.value: '_process_images_directory',
+        DirectoryType.PROCESSING.value: '_process_processing_directory',
+        DirectoryType.DIFF_CENTER.value: '_process_diff_center_directory',
+        DirectoryType.DIFF_CENTER2.value: '_process_diff_center_directory',
+        DirectoryType.SCREEN.value: '_process_screen_directory'
+    }
+
+    def __init__(self, base_path: Union[str, Path], logger: Optional[logging.Logger] = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS):
         """
         Initialize the data collector.
 
         Args:
             base_path: Root directory for data collection
             logger: Optional logger instance
+            max_workers: Maximum number of pucks processed concurrently
         """
         self.base_path = Path(base_path)
-        self.logger = logger or get_logger('imca_report.collect_data')
-        self.trip_data: DefaultDict[str, List[Any]] = defaultdict(list)
+        self.logger = logger or _LOG
+        self.max_workers = max_workers
+        self.trip_data: Dict[str, List[Any]] = {}
+        self._trip_data_lock = threading.Lock()
 
     @staticmethod
     def find_files(directory: Path, ext: str) -> List[Path]:
         """Find files with specified extension in a directory."""
         return list(directory.glob(f'*.{ext}'))
 
+    @staticmethod
+    def _find_image_files(directory: Path) -> Tuple[List[Path], Set[str]]:
+        """
+        Find HDF5 images in a directory, falling back to CBF images.
+
+        Both extensions are matched in a single directory listing, which
+        also yields the names of every entry for further lookups.
+
+        Args:
+            directory: Directory to search
+
+        Returns:
+            Paths of the .h5 files, or of the .cbf files if there are none,
+            and the names of all entries in the directory
+        """
+        h5 = []
+        cbf = []
+        names = set()
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                names.add(name)
+                if name.endswith('.h5'):
+                    h5.append(Path(entry.path))
+                elif name.endswith('.cbf'):
+                    cbf.append(Path(entry.path))
+        return h5 or cbf, names
+
+    @staticmethod
+    def _count_image_files(directory: Path) -> int:
+        """
+        Count HDF5 images in a directory, falling back to CBF images.
+
+        Args:
+            directory: Directory to search
+
+        Returns:
+            Number of .h5 files, or of .cbf files if there are none
+        """
+        h5 = 0
+        cbf = 0
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if name.endswith('.h5'):
+                    h5 += 1
+                elif name.endswith('.cbf'):
+                    cbf += 1
+        return h5 or cbf
+
+    @staticmethod
+    def _scan_directory(directory: Union[str, Path]) -> List[os.DirEntry]:
+        """
+        List a directory with a single scandir pass, sorted by name.
+
+        The returned DirEntry objects answer is_dir()/is_file() from the
+        directory listing itself, without a stat() per entry.
+
+        Args:
+            directory: Directory to list
+
+        Returns:
+            Directory entries sorted by name
+        """
+        with os.scandir(directory) as it:
+            return sorted(it, key=lambda entry: entry.name)
+
     def find_file(self, pth: Path) -> Optional[Path]:
         """
         Find a file at the given path.
@@ -119,96 +431,73 @@ class SynchrotronDataCollector:
         if pth.exists():
             return pth
 
-        self.logger.debug(f"File not found: {pth}")
+        self.logger.debug("File not found: %s", pth)
         return None
 
-    def extract_tar(self, tar_path: Path) -> None:
+    def extract_tar(self, tar_path: Path) -> bool:
         """
         Safely extract tar files with logging.
 
         Args:
             tar_path: Path to tar file
+
+        Returns:
+            True if extraction was attempted, False if a previous run already extracted it
         """
+        if _is_extracted(tar_path):
+            self.logger.debug("Skipping already extracted file: %s", tar_path.name)
+            return False
+
         try:
-            with tarfile.open(tar_path, 'r:*') as tar:
-                self.logger.info(f"Extracting compressed file: {tar_path.name}")
-                tar.extractall(path=tar_path.parent)
-        except Exception as e:
+            self.logger.info(f"Extracting compressed file: {tar_path.name}")
+            _extract_tar_archive(str(tar_path))
+        except (OSError, tarfile.TarError) as e:
             self.logger.error(f"Tar extraction failed for {tar_path}: {e}")
+        return True
 
-    def process_directory(self, directory: Path) -> Dict:
+    def _extract_tars(self, tar_paths: List[Path]) -> int:
         """
-        Process specific directories and extract relevant information.
+        Extract the tar files of a puck that previous runs have not extracted.
+
+        Archives are extracted inline on the puck's thread, pucks themselves
+        are already processed concurrently.
 
         Args:
-            directory: Directory to process
+            tar_paths: Paths to tar files
 
         Returns:
-            Dictionary of extracted information
+            Number of archives that extraction was attempted for
         """
-        directory_processors = {
-            DirectoryType.CAMERA.value: self._process_camera_directory,
-            DirectoryType.IMAGES.value: self._process_images_directory,
-            DirectoryType.PROCESSING.value: self._process_processing_directory,
-            DirectoryType.DIFF_CENTER.value: self._process_diff_center_directory,
-            DirectoryType.DIFF_CENTER2.value: self._process_diff_center2_directory,
-            DirectoryType.SCREEN.value: self._process_screen_directory
-        }
-
-        processor = directory_processors.get(directory.name)
-
-        if processor:
-            result = processor(directory)
-            self.logger.debug(f"Processed {directory.name} directory: {result}")
-            return {directory.name: result}
-
-        return {}
+        return sum(self.extract_tar(tar_path) for tar_path in tar_paths)
 
-    def _read_xml_file(self, file_path: Path) -> str:
+    def process_directory(self, directory: Path) -> Dict:
         """
-        Read XML file with multiple encoding fallbacks.
+        Process specific directories and extract relevant information.
 
         Args:
-            file_path: Path to XML file
+            directory: Directory to process
 
         Returns:
-            XML content as string
-
-        Raises:
-            XmlParsingError: If file cannot be read
-        """
-        try:
-            return file_path.read_text(encoding='utf-8')
-        except UnicodeDecodeError:
-            try:
-                return file_path.read_text(encoding='latin-1')
-            except Exception as e:
-                raise XmlParsingError(f"Failed to read XML file: {e}")
-
-    def _parse_xml_content(self, xml_content: str) -> Dict:
+            Dictionary of extracted information
         """
-        Parse XML content to dictionary.
+        name = directory.name
+        processor_name = self._PROCESSOR_NAMES.get(name)
 
-        Args:
-            xml_content: XML content as string
+        if processor_name:
+            result = getattr(self, processor_name)(directory)
+            # Formatting the result can be large, skip it unless it is logged
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Processed %s directory: %s", name, result)
+            return {name: result}
 
-        Returns:
-            Parsed XML as dictionary
-
-        Raises:
-            XmlParsingError: If XML parsing fails
-        """
-        try:
-            return Box(xmltodict.parse(xml_content, dict_constructor=dict))
-        except (ValueError, TypeError) as xml_err:
-            raise XmlParsingError(f"XML parsing error: {xml_err}")
+        return {}
 
-    def _extract_autoproc_data(self, auto_proc_container: Dict) -> Dict:
+    def _extract_autoproc_data(self, data: Dict[str, Optional[str]]) -> Dict:
         """
         Extract AutoProc data from parsed XML.
 
         Args:
-            autoproc: Parsed AutoProc XML
+            data: Fields of the AutoProc block
 
         Returns:
             Extracted data dictionary
@@ -216,20 +505,19 @@ class SynchrotronDataCollector:
         results = {}
 
         # Extract AutoProc data
-        data = auto_proc_container.get('AutoProc', {})
         cell_data = {}
         new_data = {}
         for key, value in data.items():
-            if 'Cell' in key:
-                parts = key.split('_')
-                if len(parts) >= 2:
-                    try:
-                        cell_data[parts[1].upper()] = f'{float(value):.2f}'
-                    except (ValueError, TypeError) as e:
-                        self.logger.warning(f"Failed to convert cell value '{value}' for key '{key}': {e}")
-                        cell_data[parts[1].upper()] = str(value)
-                else:
-                    self.logger.warning(f"Unexpected cell key format: '{key}', expected underscore-separated format")
+            match = CELL_KEY_PATTERN.match(key)
+            if match:
+                cell_key = match.group(1).upper()
+                try:
+                    cell_data[cell_key] = _format_cell_value(value)
+                except (ValueError, TypeError) as e:
+                    self.logger.warning(f"Failed to convert cell value '{value}' for key '{key}': {e}")
+                    cell_data[cell_key] = str(value)
+            elif 'Cell' in key:
+                self.logger.warning(f"Unexpected cell key format: '{key}', expected underscore-separated format")
             else:
                 new_data[key] = value
 
@@ -239,48 +527,37 @@ class SynchrotronDataCollector:
 
         return results
 
-    def _extract_scaling_statistics(self, auto_proc_container: Dict) -> Dict:
+    def _extract_scaling_statistics(self, scaling_stats: Sequence[Dict[str, Optional[str]]]) -> Dict:
         """
-        Extract scaling statistics from AutoProc container.
+        Extract scaling statistics from the AutoProc scaling statistics blocks.
 
         Args:
-            auto_proc_container: AutoProc container dictionary
+            scaling_stats: Fields of each AutoProcScalingStatistics block
 
         Returns:
-            Extracted scaling statistics
+            Extracted scaling statistics keyed by statistics type
         """
         results = {}
-        scaling_container = auto_proc_container.get('AutoProcScalingContainer', {})
-        scaling_stats = scaling_container.get('AutoProcScalingStatistics', [])
-
-        if scaling_stats and isinstance(scaling_stats, list):
-            for stats in scaling_stats:
-                new_stats = {}
-                for key, value in stats.items():
-                    new_key = SCALING_STATISTICS_DICT.get(key.lower())
-                    if new_key == "Scaling Statistics Type":
-                        continue
-                    elif new_key:
-                        new_stats[new_key] = value
-                    else:
-                        new_stats[key] = value
-                
-                # Safe access to scalingStatisticsType attribute
-                stats_type = getattr(stats, 'scalingStatisticsType', None)
-                if stats_type is None:
-                    # Fallback: try to get it as a dict key if stats is dict-like
-                    stats_type = stats.get('scalingStatisticsType', 'Unknown')
-                    
-                results[stats_type] = new_stats
+
+        for stats in scaling_stats:
+            new_stats = {}
+            for key, value in stats.items():
+                new_key = _scaling_statistics_name(key)
+                if new_key != SCALING_STATISTICS_TYPE_NAME:
+                    new_stats[new_key] = value
+
+            stats_type = stats.get('scalingStatisticsType', 'Unknown')
+            results[stats_type] = new_stats
 
         return results
 
-    def _process_autoproc_xml(self, file_path: Path) -> Dict:
+    def _process_autoproc_xml(self, file_path: Path, file_stat: Optional[os.stat_result] = None) -> Dict:
         """
         Process AutoProc XML file with robust error handling.
 
         Args:
             file_path: Path to the AutoProc XML file
+            file_stat: Stat result of the file if the caller already has it
 
         Returns:
             Dictionary of extracted AutoProc information
@@ -290,33 +567,36 @@ class SynchrotronDataCollector:
             self.logger.error(f"Invalid input type: Expected Path, got {type(file_path)}")
             return {}
 
-        if not file_path.is_file():
+        if file_stat is None:
+            try:
+                file_stat = file_path.stat()
+            except OSError:
+                pass
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
             self.logger.warning(f"XML file not found: {file_path}")
             return {}
 
-        try:
-            # Read and parse XML
-            xml_content = self._read_xml_file(file_path)
+        if file_stat.st_size == 0:
+            self.logger.warning(f"Empty XML file: {file_path}")
+            return {}
 
-            if not xml_content.strip():
+        try:
+            # Parse only the parts of the XML that are reported
+            parsed = _parse_autoproc_xml(str(file_path), file_stat.st_mtime_ns, file_stat.st_size)
+            if parsed is None:
                 self.logger.warning(f"Empty XML file: {file_path}")
                 return {}
-
-            autoproc = self._parse_xml_content(xml_content)
-            auto_proc_container = autoproc.get('AutoProcContainer', {})
+            auto_proc, scaling_stats = parsed
 
             # Extract data
-            results = self._extract_autoproc_data(auto_proc_container)
-            results['scale_data'] = (self._extract_scaling_statistics(auto_proc_container))
+            results = self._extract_autoproc_data(auto_proc)
+            results['scale_data'] = self._extract_scaling_statistics(scaling_stats)
 
             return results
 
         except XmlParsingError as e:
             self.logger.error(f"{e}")
             return {}
-        except Exception as unexpected_err:
-            self.logger.error(f"Unexpected XML processing error: {unexpected_err}")
-            return {}
 
     def _process_camera_directory(self, directory: Path) -> Dict:
         """Process camera directory."""
@@ -324,17 +604,15 @@ class SynchrotronDataCollector:
 
     def _process_images_directory(self, directory: Path) -> Dict:
         """Process images directory."""
-        images = self.find_files(directory, 'h5') or self.find_files(directory, 'cbf')
         return {
             'images_path': directory,
-            'num_images': len(images)
+            'num_images': self._count_image_files(directory)
         }
 
     def _process_screen_directory(self, directory: Path) -> Dict:
-        images = self.find_files(directory, 'h5') or self.find_files(directory, 'cbf')
         return {
             'images_path': directory,
-            'num_images': len(images)
+            'num_images': self._count_image_files(directory)
         }
 
     def _process_processing_directory(self, directory: Path) -> Dict:
@@ -350,11 +628,27 @@ class SynchrotronDataCollector:
         summary_html = directory / 'summary.html'
         autoproc_xml = directory / 'autoPROC.xml'
 
+        # One listing answers whether autoPROC.xml exists, and its DirEntry
+        # supplies the stat used to parse it
+        with os.scandir(directory) as it:
+            by_name = {entry.name: entry for entry in it}
+
+        autoproc_entry = by_name.get('autoPROC.xml')
+        if autoproc_entry is None:
+            self.logger.warning(f"XML file not found: {autoproc_xml}")
+            autoproc_data = {}
+        else:
+            try:
+                autoproc_stat = autoproc_entry.stat()
+            except OSError:
+                autoproc_stat = None
+            autoproc_data = self._process_autoproc_xml(autoproc_xml, autoproc_stat)
+
         return {
             'processing_path': directory,
             'summary_html_pth': summary_html,
             'autoproc_xml_pth': autoproc_xml,
-            'autoproc_xml': self._process_autoproc_xml(autoproc_xml)
+            'autoproc_xml': autoproc_data
         }
 
     def _process_diff_center_directory(self, directory: Path) -> Dict:
@@ -367,20 +661,20 @@ class SynchrotronDataCollector:
         Returns:
             Dictionary of diff center information
         """
-        images = self.find_files(directory, 'h5') or self.find_files(directory, 'cbf')
+        images, names = self._find_image_files(directory)
+
+        # The listing above already tells whether the result files exist
+        zx_result = directory / ZX_RESULT_FILE_NAME if ZX_RESULT_FILE_NAME in names else None
+        zy_result = directory / ZY_RESULT_FILE_NAME if ZY_RESULT_FILE_NAME in names else None
 
         return {
             'diff_center_path': directory,
             'diff_center_files': images,
-            'imcadr-ZX-result': self.find_file(directory / 'imcadr-ZX-result.html'),
-            'imcadr-ZY-result': self.find_file(directory / 'imcadr-ZY-result.html')
+            'imcadr-ZX-result': zx_result,
+            'imcadr-ZY-result': zy_result
         }
 
-    def _process_diff_center2_directory(self, directory: Path) -> Dict:
-        """Process diff-center2 directory."""
-        return self._process_diff_center_directory(directory)
-
-    def _process_collection(self, collection_path: Path, stats: ProcessingStats) -> Optional[Box]:
+    def _process_collection(self, collection_path: str, stats: ProcessingStats) -> Optional[Dict[str, Any]]:
         """
         Process a single collection directory.
 
@@ -389,33 +683,35 @@ class SynchrotronDataCollector:
             stats: Processing statistics to update
 
         Returns:
-            Box with collection data or None if processing failed
+            Dictionary with collection data or None if processing failed
         """
-        if not collection_path.is_dir():
-            return None
+        pos_path, collection_name = os.path.split(collection_path)
+        puck_path, pos_name = os.path.split(pos_path)
 
-        puck_name = collection_path.parent.parent.name
-        pos_name = collection_path.parent.name
-
-        dataset = Box({
-            'puck': puck_name,
+        dataset = {
+            'puck': os.path.basename(puck_path),
             'pos': pos_name,
-            'collection': collection_path.name,
-            'collection_path': collection_path
-        })
+            'collection': collection_name,
+            'collection_path': Path(collection_path)
+        }
 
         # Process collection content
         collection_processed = False
-        for child_path in collection_path.iterdir():
+        for child_entry in self._scan_directory(collection_path):
+            # Only directories with a processor become Path objects
+            if child_entry.name not in self._PROCESSOR_NAMES:
+                continue
+
+            child_path = child_entry.path
             try:
-                if child_path.is_dir():
-                    child_result = self.process_directory(child_path)
+                if child_entry.is_dir():
+                    child_result = self.process_directory(Path(child_path))
                     if child_result:
                         dataset.update(child_result)
                         collection_processed = True
-            except Exception as child_err:
+            except OSError as child_err:
                 stats.errors.append({
-                    'path': str(child_path),
+                    'path': child_path,
                     'error': str(child_err)
                 })
                 self.logger.warning(f"Error processing {child_path}: {child_err}")
@@ -427,7 +723,7 @@ class SynchrotronDataCollector:
             stats.skipped_collections += 1
             return None
 
-    def _process_position(self, pos_path: Path, stats: ProcessingStats) -> None:
+    def _process_position(self, pos_path: str, stats: ProcessingStats) -> None:
         """
         Process a position directory.
 
@@ -435,88 +731,132 @@ class SynchrotronDataCollector:
             pos_path: Path to position directory
             stats: Processing statistics to update
         """
-        if not pos_path.is_dir():
-            stats.skipped_collections += 1
-            return
-
-        puck_name = pos_path.parent.name
-        pos_name = pos_path.name
-        key = f'{puck_name}_{pos_name}'
+        puck_path, pos_name = os.path.split(pos_path)
+        key = f'{os.path.basename(puck_path)}_{pos_name}'
+        # One log line per collection, skip formatting when INFO is disabled
+        log_collections = self.logger.isEnabledFor(logging.INFO)
 
-        for collection_path in pos_path.iterdir():
-            if not collection_path.is_dir():
+        for collection_entry in self._scan_directory(pos_path):
+            if not collection_entry.is_dir():
                 continue
 
+            collection_path = collection_entry.path
             stats.total_collections += 1
-            self.logger.info(f"Processing collection: {collection_path}")
+            if log_collections:
+                self.logger.info(f"Processing collection: {collection_path}")
 
             dataset = self._process_collection(collection_path, stats)
             if dataset:
-                self.trip_data[key].append(dataset)
+                # Pucks are processed concurrently, guard the shared trip_data
+                with self._trip_data_lock:
+                    bucket = self.trip_data.get(key)
+                    if bucket is None:
+                        bucket = self.trip_data[key] = []
+                    bucket.append(dataset)
 
-    def _process_puck(self, puck_path: Path, stats: ProcessingStats) -> None:
+    def _process_puck(self, puck_path: str, stats: ProcessingStats) -> None:
 
         """
         Process a puck directory containing position directories.
 
         Args:
-            puck_path: Path to the puck directory
+            puck_path: Path to the puck directory, callers only pass directories
             stats: Processing statistics to update
 
         Raises:
-            Exception: If processing of the puck fails
+            OSError: If the puck directory cannot be read
         """
-        if not puck_path.is_dir():
-            self.logger.warning(f"Skipping {puck_path}, not a directory")
-            return
-
-        self.logger.info(f"Processing puck: {puck_path.name}")
-
-        # Extract any tar files if present
-        for tar_file in puck_path.glob("*.tar*"):
-            self.extract_tar(tar_file)
+        puck_name = os.path.basename(puck_path)
+        self.logger.info(f"Processing puck: {puck_name}")
+
+        # Sort positions and tar files out of a single listing
+        pos_entries = []
+        tar_paths = []
+        for entry in self._scan_directory(puck_path):
+            if entry.is_dir():
+                pos_entries.append(entry)
+            elif entry.name.endswith(TAR_SUFFIXES) and entry.is_file():
+                tar_paths.append(Path(entry.path))
+
+        # Extract any tar files if present, they may add positions
+        if self._extract_tars(tar_paths):
+            pos_entries = [entry for entry in self._scan_directory(puck_path) if entry.is_dir()]
 
         # Process each position in the puck
         position_count = 0
-        for pos_path in puck_path.iterdir():
-            if not pos_path.is_dir():
-                continue
-
+        for pos_entry in pos_entries:
+            pos_path = pos_entry.path
             position_count += 1
             try:
                 self._process_position(pos_path, stats)
-            except Exception as e:
-                self.logger.error(f"Error processing position {pos_path.name}: {e}")
+            except OSError as e:
+                self.logger.error(f"Error processing position {pos_entry.name}: {e}")
                 stats.errors.append({
-                    'path': str(pos_path),
+                    'path': pos_path,
                     'error': str(e)
                 })
 
         if position_count == 0:
-            self.logger.warning(f"No position directories found in puck: {puck_path.name}")
+            self.logger.warning(f"No position directories found in puck: {puck_name}")
+
+    def _process_puck_task(self, puck_path: str) -> ProcessingStats:
+        """
+        Process a puck with its own statistics so it can run on a worker thread.
+
+        Args:
+            puck_path: Path to the puck directory
+
+        Returns:
+            Processing statistics for this puck
+        """
+        stats = ProcessingStats(total_pucks=1)
+        try:
+            self._process_puck(puck_path, stats)
+            stats.processed_pucks += 1
+        except Exception as pos_err:
+            # One bad puck is recorded and skipped instead of ending the run
+            stats.skipped_pucks += 1
+            stats.errors.append({
+                'path': puck_path,
+                'error': str(pos_err)
+            })
+            self.logger.error(f"Error processing puck path {puck_path}: {pos_err}")
+        return stats
+
+    def _process_pucks(self, puck_paths: List[str], stats: ProcessingStats) -> None:
+        """
+        Process puck directories concurrently on a thread pool.
+
+        Puck processing is dominated by blocking filesystem calls, so threads
+        overlap the I/O latency. Each puck collects its own statistics, which
+        are merged into stats in submission order, so the output matches the
+        serial path.
 
-    def _process_site(self, site_path: Path, stats: ProcessingStats) -> None:
-        """Process a site directory containing pucks."""
-        if site_path.is_file():
-            self.logger.info(f"Skipping {site_path}, not a directory")
+        Args:
+            puck_paths: Paths to the puck directories
+            stats: Processing statistics to update
+        """
+        if self.max_workers <= 1 or len(puck_paths) <= 1:
+            for puck_path in puck_paths:
+                stats.merge(self._process_puck_task(puck_path))
             return
 
-        for puck_path in site_path.iterdir():
-            if not puck_path.is_dir():
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(puck_paths))) as executor:
+            for puck_stats in executor.map(self._process_puck_task, puck_paths):
+                stats.merge(puck_stats)
+
+    def _process_site(self, site_path: str, stats: ProcessingStats) -> None:
+        """Process a site directory containing pucks, callers only pass directories."""
+        site_name = os.path.basename(site_path)
+        puck_paths = []
+        for puck_entry in self._scan_directory(site_path):
+            if not puck_entry.is_dir():
                 continue
 
-            self.logger.info(f"Found Site {site_path.name}")
-            stats.total_pucks += 1
-            try:
-                self._process_puck(puck_path, stats)
-                stats.processed_pucks += 1
-            except Exception as pos_err:
-                stats.skipped_pucks += 1
-                stats.errors.append({
-                    'path': str(puck_path),
-                    'error': str(pos_err)
-                })
-                self.logger.error(f"Error processing puck path {puck_path}: {pos_err}")
+            self.logger.info(f"Found Site {site_name}")
+            puck_paths.append(puck_entry.path)
+
+        self._process_pucks(puck_paths, stats)
 
     def collect_data(self, no_site: bool) -> Dict:
         """
@@ -540,22 +880,29 @@ class SynchrotronDataCollector:
         stats = ProcessingStats()
 
         try:
+            directories = []
+            for entry in self._scan_directory(self.base_path):
+                if entry.is_dir():
+                    directories.append(entry.path)
+                else:
+                    self.logger.info(f"Skipping {entry.path}, not a directory")
+
             if no_site:
-                self.logger.info(f"Users provide no site flag")
-                for puck_pth in self.base_path.iterdir():
-                    self._process_puck(puck_pth, stats)
+                self.logger.info("Users provide no site flag")
+                self._process_pucks(directories, stats)
             else:
-                for site_path in self.base_path.iterdir():
+                for site_path in directories:
                     self._process_site(site_path, stats)
 
-
             # Log processing summary
             self.logger.info(f"Data collection summary: {stats}")
             self.logger.info(f"Data collection completed. Total Samples: {len(self.trip_data)}")
 
+            # Insert trip_data in key order so the output is deterministic
+            # without having to sort keys again when serializing
             return {
                 'trip_name': trip_name,
-                'trip_data': self.trip_data,
+                'trip_data': dict(sorted(self.trip_data.items())),
                 'processing_stats': vars(stats)
             }
 
@@ -1,17 +1,58 @@
+import errno
 import functools
+import itertools
+import os
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Union, Optional
+from typing import Any, Callable, Dict, List, Literal, Set, Tuple, Union, Optional
 
 from jinja2 import Environment
+from jinja2 import FileSystemBytecodeCache
 from jinja2 import FileSystemLoader
+from jinja2 import select_autoescape
 
 from .logging_config import get_logger
 
 
+# Default number of puck keys processed concurrently, more threads mostly
+# contend for the directory locks of a single output volume
+DEFAULT_MAX_WORKERS = 4
+
+# Bytes requested per os.copy_file_range or os.sendfile call, the kernel
+# copies less at a time
+KERNEL_COPY_SIZE = 1 << 30
+
+# Errors for which an in-kernel copy is unsupported and copying falls back
+KERNEL_COPY_FALLBACK_ERRNOS = frozenset(
+    (errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP, errno.ENOTSUP, errno.ENOTSOCK)
+)
+
+# Only Linux sendfile accepts a regular file as destination, as in shutil
+USE_SENDFILE = hasattr(os, 'sendfile') and sys.platform.startswith('linux')
+
+# Buffer size for userspace file copies
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Shared stand-in for missing sections of an entry, only ever read
+_EMPTY: Dict[str, Any] = {}
+
+# Write buffer size for rendered pages
+RENDER_BUFFER_SIZE = 1 << 20
+
+# Number of compiled templates kept by the Jinja2 environment
+TEMPLATE_CACHE_SIZE = 400
+
+# File name pattern of the on-disk template bytecode cache. Bytecode is keyed
+# by template source only, so the pattern changes with options that alter the
+# compiled code, such as autoescaping
+TEMPLATE_BYTECODE_PATTERN = '__trip_report_autoescape_%s.cache'
+
+
 class FileHandlingMethod(Enum):
     """
     Enumeration of methods for handling files during report generation.
@@ -19,12 +60,37 @@ class FileHandlingMethod(Enum):
     Defines the strategies for transferring files when creating reports:
     - SYMLINK: Create symbolic links to original files
     - COPY: Create physical copies of files
+    - HARDLINK: Create hard links to original files, copying them when the
+      report is on a different filesystem
     """
     SYMLINK = "symlink"
     COPY = "copy"
+    HARDLINK = "hardlink"
 
 
 @dataclass
+class FileOperation:
+    """
+    A file to place in the report, planned before any file is touched.
+
+    Attributes:
+        source_path (Path): Original location of the file
+        output_dir (Path): Directory to place the file in
+        filename (str): Name of the file in the output directory
+        record (Callable[[str], None]): Stores the file's relative path in its entry
+        label (Optional[str]): Kind of file named in error messages; failures of
+            labelled operations are logged and skipped, others are raised
+        preserve_metadata (bool): Whether copies keep permission bits and timestamps
+    """
+    source_path: Path
+    output_dir: Path
+    filename: str
+    record: Callable[[str], None]
+    label: Optional[str] = None
+    preserve_metadata: bool = True
+
+
+@dataclass(frozen=True)
 class CameraFile:
     """
     Represents a camera file with its source and destination paths.
@@ -33,11 +99,14 @@ class CameraFile:
         source_path (Path): Original location of the camera file
         relative_path (str): Relative path of the file in the generated report
     """
+    # Explicit slots instead of slots=True, which needs Python 3.10
+    __slots__ = ('source_path', 'relative_path')
+
     source_path: Path
     relative_path: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class ReportConfig:
     """
     Configuration settings for report generation.
@@ -48,6 +117,8 @@ class ReportConfig:
         report_title (str): Title of the generated report
         csv_loaded (bool): Whether or not the generated report was loaded
     """
+    __slots__ = ('output_dir', 'file_method', 'report_title', 'csv_loaded')
+
     output_dir: Path
     file_method: FileHandlingMethod
     report_title: str
@@ -81,6 +152,123 @@ class TemplateRenderingError(IMCAReportError):
     pass
 
 
+def _path_prefix(directory: Path) -> str:
+    """
+    Get the string that paths built under a directory start with.
+
+    Args:
+        directory: Directory paths are built under
+
+    Returns:
+        Directory with a trailing separator, or an empty string for the
+        current directory, whose children have no prefix
+    """
+    directory_str = os.fspath(directory)
+    if directory_str == os.curdir:
+        return ''
+    return os.path.join(directory_str, '')
+
+
+def _copy_file(source_path: Union[str, Path], dest_path: Union[str, Path], preserve_metadata: bool = True) -> None:
+    """
+    Copy a file, letting the kernel move the data where possible.
+
+    Prefers os.copy_file_range, which copies in the kernel and can clone
+    blocks on copy-on-write filesystems, then os.sendfile on Linux, which
+    still copies in the kernel, and finally a buffered copy when neither is
+    available or supported for the pair of files. Each step continues
+    from wherever the previous one stopped.
+
+    Args:
+        source_path: Path to the source file
+        dest_path: Path of the copy
+        preserve_metadata: Whether to copy permission bits and timestamps
+
+    Raises:
+        OSError: If the file cannot be copied
+    """
+    with open(source_path, 'rb') as src, open(dest_path, 'wb') as dst:
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+        # Some filesystems report end of file right away instead of failing, a
+        # kernel copy only counts as done if it moved data or there was none
+        source_empty = os.fstat(src_fd).st_size == 0
+        copied = False
+        if hasattr(os, 'copy_file_range'):
+            try:
+                total = 0
+                sent = os.copy_file_range(src_fd, dst_fd, KERNEL_COPY_SIZE)
+                while sent:
+                    total += sent
+                    sent = os.copy_file_range(src_fd, dst_fd, KERNEL_COPY_SIZE)
+                copied = total > 0 or source_empty
+            except OSError as e:
+                if e.errno not in KERNEL_COPY_FALLBACK_ERRNOS:
+                    raise
+        if not copied and USE_SENDFILE:
+            try:
+                # A None offset reads from and advances the source position
+                total = 0
+                sent = os.sendfile(dst_fd, src_fd, None, KERNEL_COPY_SIZE)
+                while sent:
+                    total += sent
+                    sent = os.sendfile(dst_fd, src_fd, None, KERNEL_COPY_SIZE)
+                copied = total > 0 or source_empty
+            except OSError as e:
+                if e.errno not in KERNEL_COPY_FALLBACK_ERRNOS:
+                    raise
+        if not copied:
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+
+    if preserve_metadata:
+        shutil.copystat(source_path, dest_path)
+
+
+def _camera_sort_key(path: Path) -> Tuple[int, str]:
+    """
+    Sort key placing 'before' images first, then 'after' images, then by name.
+
+    Camera files all live in one directory, so the name alone breaks ties.
+
+    Args:
+        path: Camera file path
+
+    Returns:
+        Sort key for the camera file
+    """
+    name = path.name
+    name_lower = name.lower()
+    priority = 0 if 'before' in name_lower else 1 if 'after' in name_lower else 2
+    return priority, name
+
+
+@functools.lru_cache(maxsize=None)
+def _template_environment(template_dir: str) -> Environment:
+    """
+    Get the shared Jinja2 environment for a template directory.
+
+    The environment keeps its compiled templates, so reusing one across
+    generator instances avoids recompiling them for every report. Templates
+    ship with the package and do not change at runtime, so they are not
+    checked for updates. Compiled bytecode is also cached on disk in the
+    system temporary directory, so new processes skip parsing them. Values
+    rendered into HTML templates are escaped.
+
+    Args:
+        template_dir: Directory containing Jinja2 templates
+
+    Returns:
+        Jinja2 environment loading templates from template_dir
+    """
+    env = Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=select_autoescape(['html']),
+        auto_reload=False,
+        cache_size=TEMPLATE_CACHE_SIZE,
+        bytecode_cache=FileSystemBytecodeCache(pattern=TEMPLATE_BYTECODE_PATTERN)
+    )
+    return env
+
+
 class IMCAReportGenerator:
     """
     Generates comprehensive HTML reports for IMCA (Integrated Macromolecular Crystallography Automation) data.
@@ -96,21 +284,28 @@ class IMCAReportGenerator:
         env (jinja2.Environment): Jinja2 template rendering environment
     """
 
-    def __init__(self, data: Dict[str, Any]):
+    def __init__(self, data: Dict[str, Any], max_workers: int = DEFAULT_MAX_WORKERS):
         """
         Initialize the report generator with collected synchrotron data.
 
         Args:
             data: Dictionary containing IMCA data to be processed in the report
+            max_workers: Maximum number of puck keys processed concurrently
         """
         self.logger = get_logger('imca_report.report_generator')
         self.imca_data = data
+        self.max_workers = max_workers
         self.report_root = Path()
+        self._report_root_prefix = _path_prefix(self.report_root)
+        self._created_dirs: Set[str] = set()
+        self._camera_cache: Dict[str, List[Path]] = {}
+        self._render_time = datetime.now()
 
         # Setup Jinja2 environment
         self.template_dir = Path(__file__).parent / 'templates'
-        self.env = Environment(loader=FileSystemLoader(str(self.template_dir)))
-        self.env.globals.update(now=datetime.now)
+        self.env = _template_environment(str(self.template_dir))
+        self._index_template = self.env.get_template('index.html')
+        self._detail_template = self.env.get_template('detail.html')
 
     def _find_camera_files(self, collection_path: Union[str, Path]) -> List[Path]:
         """
@@ -118,6 +313,7 @@ class IMCAReportGenerator:
 
         Locates and sorts camera files (*.jpg) in the 'camera' subdirectory,
         with a specific sorting order prioritizing 'before' and 'after' images.
+        Results are cached per collection path for the current report.
 
         Args:
             collection_path: Path to the collection directory
@@ -125,36 +321,54 @@ class IMCAReportGenerator:
         Returns:
             Sorted list of camera file paths
         """
-        camera_dir = Path(collection_path) / 'camera'
-        if not camera_dir.exists():
-            return []
+        cache_key = os.fspath(collection_path)
+        cached = self._camera_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        camera_dir = os.path.join(cache_key, 'camera')
+        try:
+            with os.scandir(camera_dir) as it:
+                files = [
+                    Path(entry.path) for entry in it
+                    if entry.name.endswith('.jpeg') and entry.is_file()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            files = []
 
         # Sort files with specific ordering
-        files = list(camera_dir.glob('*.jpeg'))
-        return sorted(
-            files,
-            key=lambda x: (
-                'before' not in x.name.lower(),
-                'after' not in x.name.lower(),
-                str(x)
-            )
-        )
+        files.sort(key=_camera_sort_key)
+        self._camera_cache[cache_key] = files
+        return files
+
+    def _ensure_dir(self, directory: str) -> None:
+        """
+        Create an output directory, once per report.
+
+        Args:
+            directory: Directory to create
+        """
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
 
     def _handle_file(
             self,
             source_path: Path,
             output_dir: Path,
             filename: str,
-            method: FileHandlingMethod
+            method: FileHandlingMethod,
+            preserve_metadata: bool = True
     ) -> str:
         """
-        Handle file by either creating a symlink or copying the file.
+        Handle file by creating a symlink or hard link, or by copying the file.
 
         Args:
             source_path: Path to the source file
             output_dir: Directory to place the file
             filename: Name of the file in the output directory
-            method: Method to handle the file (symlink or copy)
+            method: Method to handle the file (symlink, copy or hardlink)
+            preserve_metadata: Whether copies keep permission bits and timestamps
 
         Returns:
             Relative path of the file in the output directory
@@ -162,239 +376,284 @@ class IMCAReportGenerator:
         Raises:
             FileHandlingError: If file handling operations fail
         """
-        output_dir.mkdir(parents=True, exist_ok=True)
-        dest_path = output_dir / filename
+        # Work on plain strings, this runs for every file in the report
+        output_dir_str = os.fspath(output_dir)
 
-        # Remove existing file/symlink if it exists
-        if dest_path.exists():
-            dest_path.unlink()
+        self._ensure_dir(output_dir_str)
+        dest_path = os.path.join(output_dir_str, filename)
+
+        # Remove existing file/symlink if it exists, including broken symlinks
+        try:
+            os.unlink(dest_path)
+        except FileNotFoundError:
+            pass
 
         # Handle file based on method
         try:
             if method == FileHandlingMethod.SYMLINK:
-                dest_path.symlink_to(source_path)
+                os.symlink(source_path, dest_path)
             elif method == FileHandlingMethod.COPY:
-                shutil.copy2(source_path, dest_path)
+                _copy_file(source_path, dest_path, preserve_metadata)
+            elif method == FileHandlingMethod.HARDLINK:
+                try:
+                    os.link(source_path, dest_path)
+                except OSError as e:
+                    # Hard links cannot cross filesystems
+                    if e.errno != errno.EXDEV:
+                        raise
+                    _copy_file(source_path, dest_path, preserve_metadata)
         except (OSError, PermissionError) as e:
             self.logger.error(f"Error handling file {source_path}: {e}")
             raise FileHandlingError(f"File handling error: {e}") from e
 
-        return str(dest_path.relative_to(self.report_root))
+        # Output directories are built from the report root, so the relative
+        # path is the remainder after the root prefix
+        prefix = self._report_root_prefix
+        if dest_path.startswith(prefix):
+            return dest_path[len(prefix):]
+        return os.path.relpath(dest_path, self.report_root)
 
-    def _create_camera_files(
+    def _plan_camera_files(
             self,
-            camera_files: List[Path],
-            output_path: Path,
+            entry: Dict[str, Any],
             puck_key: str,
-            method: FileHandlingMethod
-    ) -> List[str]:
+            output_path: Path
+    ) -> List[FileOperation]:
         """
-        Create camera files in the output directory.
+        Plan the camera files of an entry.
 
         Args:
-            camera_files: List of original camera file paths
+            entry: Data entry to process
+            puck_key: Current puck key
             output_path: Output directory path
-            puck_key: Current puck key for organizing files
-            method: Method to handle files (symlink or copy)
 
         Returns:
-            List of relative file paths
+            File operations for the camera files
         """
+        collection_path = entry.get('collection_path')
+        if not collection_path:
+            return []
+
+        camera_files = self._find_camera_files(collection_path)
+        if not camera_files:
+            return []
+
         camera_output_dir = output_path / 'camera' / puck_key
-        handle_file_partial = functools.partial(
-            self._handle_file,
-            output_dir=camera_output_dir,
-            method=method
-        )
 
+        # Replace the source paths with the report paths as files are placed,
+        # by position since files may be placed in any order, and through the
+        # list as stored since the entry may convert it
+        camera = entry.setdefault('camera', {})
+        camera['camera_files'] = [None] * len(camera_files)
+        set_path = camera['camera_files'].__setitem__
+
+        # Camera image metadata is not shown in the report, skip copying it
         return [
-            handle_file_partial(source_path=file, filename=file.name)
-            for file in camera_files
+            FileOperation(file, camera_output_dir, file.name, functools.partial(set_path, index),
+                          preserve_metadata=False)
+            for index, file in enumerate(camera_files)
         ]
 
-    def _process_summary_file(
+    def _plan_summary_file(
             self,
             entry: Dict[str, Any],
             puck_key: str,
-            output_path: Path,
-            file_method: FileHandlingMethod
-    ) -> None:
+            output_path: Path
+    ) -> List[FileOperation]:
         """
-        Process summary file for an entry.
+        Plan the summary file of an entry.
 
         Args:
             entry: Data entry to process
             puck_key: Current puck key
             output_path: Output directory path
-            file_method: Method to handle files
+
+        Returns:
+            File operation for the summary file, if there is one
         """
         processing = entry.get('processing', {})
         summary_path_str = processing.get('summary_html_pth')
 
         if not summary_path_str:
-            return
+            return []
 
         summary_path = Path(summary_path_str)
         self.logger.info(f"Processing summary file: {summary_path}")
 
         if not summary_path.is_file():
             self.logger.warning(f"Summary file not found: {summary_path}")
-            return
-
-        summary_output_dir = output_path / 'summary'
-        summary_filename = f'{puck_key}_summary.html'
-
-        try:
-            summary_file_path = self._handle_file(
-                summary_path,
-                summary_output_dir,
-                summary_filename,
-                file_method
-            )
+            return []
 
+        def record(summary_file_path: str) -> None:
             entry.setdefault('summary', {})['summary_file'] = summary_file_path
             self.logger.info(f"Summary file processed: {summary_file_path}")
-        except FileHandlingError as e:
-            self.logger.error(f"Error processing summary file {summary_path}: {e}")
 
-    def _process_diff_center_results(
+        return [FileOperation(
+            summary_path,
+            output_path / 'summary',
+            f'{puck_key}_summary.html',
+            record,
+            label='summary file'
+        )]
+
+    def _plan_diff_center_results(
             self,
             entry: Dict[str, Any],
             puck_key: str,
-            output_path: Path,
-            file_method: FileHandlingMethod
-    ) -> None:
+            output_path: Path
+    ) -> List[FileOperation]:
         """
-        Process diff-center result files.
+        Plan the diff-center result files of an entry.
 
         Args:
             entry: Data entry to process
             puck_key: Current puck key
             output_path: Output directory path
-            file_method: Method to handle files
+
+        Returns:
+            File operations for the existing result files
         """
         diff_center = entry.get('diff-center', {})
         if not isinstance(diff_center, dict):
             self.logger.warning(f"Invalid diff-center for {puck_key}: not a dictionary")
-            return
+            return []
 
         result_output_dir = output_path / 'results'
-
-        # Process ZX result
-        self._process_result_file(
-            diff_center,
-            'imcadr-ZX-result',
-            f'{puck_key}_zx_result.html',
-            result_output_dir,
-            file_method
-        )
-
-        # Process ZY result
-        self._process_result_file(
-            diff_center,
-            'imcadr-ZY-result',
-            f'{puck_key}_zy_result.html',
-            result_output_dir,
-            file_method
-        )
-
-        entry.update({'diff_center': diff_center})
-
-    def _process_result_file(
-            self,
-            diff_center: Dict[str, Any],
-            key: str,
-            filename: str,
-            output_dir: Path,
-            file_method: FileHandlingMethod
-    ) -> None:
-        """
-        Process a single result file.
-
-        Args:
-            diff_center: Diff center data dictionary
-            key: Key for the result file
-            filename: Output filename
-            output_dir: Output directory
-            file_method: Method to handle files
-        """
-        result_path_str = diff_center.get(key)
-        if not result_path_str:
-            return
-
-        result_path = Path(result_path_str)
-        if not result_path.is_file():
-            return
-
-        try:
-            result_file_path = self._handle_file(
+        operations = []
+        for key, filename in (
+                ('imcadr-ZX-result', f'{puck_key}_zx_result.html'),
+                ('imcadr-ZY-result', f'{puck_key}_zy_result.html')
+        ):
+            result_path_str = diff_center.get(key)
+            if not result_path_str:
+                continue
+
+            result_path = Path(result_path_str)
+            if not result_path.is_file():
+                continue
+
+            operations.append(FileOperation(
                 result_path,
-                output_dir,
+                result_output_dir,
                 filename,
-                file_method
-            )
-            diff_center[f'{key}_local'] = result_file_path
-        except FileHandlingError as e:
-            self.logger.error(f"Error processing result file {result_path}: {e}")
+                functools.partial(diff_center.__setitem__, f'{key}_local'),
+                label='result file'
+            ))
 
-    def _process_camera_files(
+        entry.update({'diff_center': diff_center})
+        return operations
+
+    def _build_file_plan(
             self,
             entry: Dict[str, Any],
             puck_key: str,
-            output_path: Path,
-            file_method: FileHandlingMethod
-    ) -> None:
+            output_path: Path
+    ) -> List[FileOperation]:
         """
-        Process camera files for an entry.
+        Plan every file an entry places in the report.
 
         Args:
             entry: Data entry to process
             puck_key: Current puck key
             output_path: Output directory path
-            file_method: Method to handle files
+
+        Returns:
+            File operations for the camera, summary and diff-center result files
         """
-        collection_path = entry.get('collection_path')
-        if not collection_path:
-            return
+        return (
+            self._plan_camera_files(entry, puck_key, output_path)
+            + self._plan_summary_file(entry, puck_key, output_path)
+            + self._plan_diff_center_results(entry, puck_key, output_path)
+        )
 
-        camera_files = self._find_camera_files(collection_path)
-        if not camera_files:
-            return
+    def _collect_all_operations(
+            self,
+            entries: List[Tuple[str, Dict[str, Any]]],
+            output_path: Path
+    ) -> List[List[FileOperation]]:
+        """
+        Plan the report files of every entry before any file is placed.
 
-        # Create camera files
-        symlink_paths = self._create_camera_files(
-            camera_files,
-            output_path,
-            puck_key,
-            file_method
-        )
+        Operations placing a file at the same destination are grouped. Only
+        the last one is carried out, as it would have overwritten the others,
+        and every operation in the group records the resulting path. Groups
+        are ordered by source directory so reads from one directory are
+        issued together.
+
+        Args:
+            entries: (puck key, entry) pairs of the report
+            output_path: Output directory path
+
+        Returns:
+            Groups of file operations sharing a destination
+        """
+        by_destination: Dict[Tuple[str, str], List[FileOperation]] = {}
+        for puck_key, entry in entries:
+            for operation in self._build_file_plan(entry, puck_key, output_path):
+                destination = (os.fspath(operation.output_dir), operation.filename)
+                by_destination.setdefault(destination, []).append(operation)
 
-        entry.setdefault('camera', {})['camera_files'] = symlink_paths
+        groups = list(by_destination.values())
+        groups.sort(key=lambda group: os.path.dirname(group[-1].source_path))
+        return groups
 
-    def _process_entry(
+    def _execute_file_operations(
             self,
-            entry: Dict[str, Any],
-            puck_key: str,
-            output_path: Path,
+            groups: List[List[FileOperation]],
             file_method: FileHandlingMethod
     ) -> None:
         """
-        Process a single data entry.
+        Carry out grouped file operations and record their report paths.
+
+        Failures of labelled operations are logged and skipped, any other
+        failure is raised.
 
         Args:
-            entry: Data entry to process
-            puck_key: Current puck key
-            output_path: Output directory path
+            groups: Groups of file operations sharing a destination
             file_method: Method to handle files
+
+        Raises:
+            FileHandlingError: If an unlabelled file operation fails
         """
-        # Process camera files
-        self._process_camera_files(entry, puck_key, output_path, file_method)
+        handle_file = self._handle_file
+        for group in groups:
+            operation = group[-1]
+            try:
+                relative_path = handle_file(
+                    operation.source_path,
+                    operation.output_dir,
+                    operation.filename,
+                    file_method,
+                    operation.preserve_metadata
+                )
+            except FileHandlingError as e:
+                if operation.label is None:
+                    raise
+                self.logger.error(f"Error processing {operation.label} {operation.source_path}: {e}")
+                continue
+            for planned in group:
+                planned.record(relative_path)
+
+    def _run_tasks(self, func: Callable[..., None], tasks: List[Tuple[Any, ...]]) -> None:
+        """
+        Run tasks on a thread pool, or inline when a pool would not help.
+
+        Args:
+            func: Function called with the arguments of each task
+            tasks: Arguments of each task
 
-        # Process summary file
-        self._process_summary_file(entry, puck_key, output_path, file_method)
+        Raises:
+            Exception: The first exception raised by a task
+        """
+        if self.max_workers <= 1 or len(tasks) <= 1:
+            for args in tasks:
+                func(*args)
+            return
 
-        # Process diff-center results
-        self._process_diff_center_results(entry, puck_key, output_path, file_method)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as executor:
+            futures = [executor.submit(func, *args) for args in tasks]
+            for future in as_completed(futures):
+                future.result()
 
     def _render_index_page(self, config: ReportConfig) -> None:
         """
@@ -407,15 +666,14 @@ class IMCAReportGenerator:
             TemplateRenderingError: If template rendering fails
         """
         try:
-            index_template = self.env.get_template('index.html')
-            index_html = index_template.render(
-                report_title=config.report_title,
-                csv_loaded=config.csv_loaded,
-                imca_data=self.imca_data
-            )
-
-            with (config.output_dir / 'index.html').open('w') as f:
-                f.write(index_html)
+            # Stream the page to the file instead of building it in memory
+            with (config.output_dir / 'index.html').open('w', buffering=RENDER_BUFFER_SIZE) as f:
+                self._index_template.stream(
+                    report_title=config.report_title,
+                    csv_loaded=config.csv_loaded,
+                    imca_data=self.imca_data,
+                    now=self._render_time
+                ).dump(f)
         except Exception as e:
             self.logger.error(f"Error generating index page: {e}")
             raise TemplateRenderingError(f"Index page generation failed: {e}") from e
@@ -438,23 +696,25 @@ class IMCAReportGenerator:
             TemplateRenderingError: If template rendering fails
         """
         try:
-            detail_template = self.env.get_template('detail.html')
-            detail_html = detail_template.render(
-                puck_key=puck_key,
-                collection=entry.get('collection', 'Unknown'),
-                pos=entry.get('pos', 'N/A'),
-                collection_path=entry.get('collection_path', 'N/A'),
-                summary=entry.get('summary', {}).get('summary_file', None),
-                camera_files=entry.get('camera', {}).get('camera_files', []),
-                diff_center=entry.get('diff-center', {}),
-                processing=entry.get('processing', {}).get('autoproc_xml', {}),
-                images=entry.get('images', {}),
-                screen=entry.get('screen', {})
-            )
+            context = {
+                'puck_key': puck_key,
+                'collection': entry.get('collection', 'Unknown'),
+                'pos': entry.get('pos', 'N/A'),
+                'collection_path': entry.get('collection_path', 'N/A'),
+                # Box wraps dict defaults passed to get() in a new Box,
+                # so missing sections fall back to _EMPTY afterwards
+                'summary': (entry.get('summary') or _EMPTY).get('summary_file'),
+                'camera_files': (entry.get('camera') or _EMPTY).get('camera_files', ()),
+                'diff_center': entry.get('diff-center') or _EMPTY,
+                'processing': (entry.get('processing') or _EMPTY).get('autoproc_xml') or _EMPTY,
+                'images': entry.get('images') or _EMPTY,
+                'screen': entry.get('screen') or _EMPTY,
+                'now': self._render_time
+            }
 
             detail_filename = f'{puck_key}_{entry.get("collection", "unknown")}_details.html'
-            with (output_path / detail_filename).open('w') as f:
-                f.write(detail_html)
+            with (output_path / detail_filename).open('w', buffering=RENDER_BUFFER_SIZE) as f:
+                self._detail_template.stream(**context).dump(f)
         except Exception as e:
             self.logger.error(f"Error generating detail page: {e}")
             raise TemplateRenderingError(f"Detail page generation failed: {e}") from e
@@ -462,7 +722,7 @@ class IMCAReportGenerator:
     def generate_reports(
             self,
             output_dir: Union[str, Path] = 'reports',
-            file_method: Literal['symlink', 'copy'] = 'copy',
+            file_method: Literal['symlink', 'copy', 'hardlink'] = 'copy',
             report_title: str = 'IMCA Data Summary',
             csv_loaded: bool = False,
     ) -> None:
@@ -471,7 +731,7 @@ class IMCAReportGenerator:
 
         Args:
             output_dir: Directory to save generated HTML files
-            file_method: Method to handle files ('symlink' or 'copy')
+            file_method: Method to handle files ('symlink', 'copy' or 'hardlink')
             report_title: Title for the report
 
         Raises:
@@ -480,7 +740,13 @@ class IMCAReportGenerator:
         # Create output directory if it doesn't exist
         output_path = Path(output_dir)
         self.report_root = output_path
+        self._report_root_prefix = _path_prefix(output_path)
         output_path.mkdir(parents=True, exist_ok=True)
+        self._created_dirs = {os.fspath(output_path)}
+        self._camera_cache = {}
+
+        # One timestamp for every page, the report is generated as a whole
+        self._render_time = datetime.now()
 
         # Convert string method to enum
         method = FileHandlingMethod(file_method)
@@ -493,16 +759,33 @@ class IMCAReportGenerator:
             csv_loaded=csv_loaded,
         )
 
-        # Generate index page
-        self._render_index_page(config)
+        # Snapshot the entries once, planning and rendering both walk them
+        entries = [
+            (puck_key, entry)
+            for puck_key, puck_data in self.imca_data.items()
+            for entry in puck_data
+        ]
+        self.logger.info(f"Generating reports for {len(entries)} entries")
+
+        # Plan every file first, then create the output directories once
+        groups = self._collect_all_operations(entries, output_path)
+        for output_dir in {group[-1].output_dir for group in groups}:
+            self._ensure_dir(os.fspath(output_dir))
+
+        # Destinations are unique now, so file handling, which is I/O bound,
+        # is spread over a thread pool in batches sharing a source directory
+        batches = [
+            (list(batch), method)
+            for _, batch in itertools.groupby(groups, key=lambda group: os.path.dirname(group[-1].source_path))
+        ]
+        self._run_tasks(self._execute_file_operations, batches)
 
-        # Process data and generate detail pages
-        for puck_key, puck_data in self.imca_data.items():
-            # Process each entry in the puck data
-            for entry in puck_data:
-                # Process entry files
-                self._process_entry(entry, puck_key, output_path, method)
-                # Render detail page
-                self._render_detail_page(entry, puck_key, output_path)
+        # Render detail pages once every entry has its report paths
+        self._run_tasks(self._render_detail_page, [
+            (entry, puck_key, output_path) for puck_key, entry in entries
+        ])
+
+        # Generate index page once all entries are processed
+        self._render_index_page(config)
 
         self.logger.info(f"Reports generated in {output_path}")